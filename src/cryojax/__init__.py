@@ -1,6 +1,8 @@
+import importlib
+from typing import Any, TYPE_CHECKING
+
 from . import (
     coordinates as coordinates,
-    data as data,
     image as image,
     inference as inference,
     rotations as rotations,
@@ -13,3 +15,19 @@ from ._filtered_transformations import (
     filter_vmap_with_spec as filter_vmap_with_spec,
 )
 from .cryojax_version import __version__ as __version__
+
+
+if TYPE_CHECKING:
+    from . import data as data
+
+
+def __getattr__(name: str) -> Any:
+    # Import `cryojax.data` on first access. It depends on `pandas` and `starfile`,
+    # which are slow to import and not needed to simulate images
+    if name == "data":
+        return importlib.import_module(f"{__name__}.data")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), "data"])
@@ -1,35 +1,46 @@
 """
 Utilities for runtime errors, wrapping `equinox.error_if`.
+
+These checks are added to the computation graph, so they have a cost at
+runtime. They can be turned off by setting the environment variable
+`CRYOJAX_ENABLE_RUNTIME_CHECKS=0` (or `false`) before importing `cryojax`.
 """
 
+import os
+
 import equinox as eqx
 import jax.numpy as jnp
-from jaxtyping import Array, ArrayLike
+from jaxtyping import Array, ArrayLike, Bool
+
+
+_ENABLE_RUNTIME_CHECKS = os.environ.get(
+    "CRYOJAX_ENABLE_RUNTIME_CHECKS", "1"
+).strip().lower() not in ("0", "false")
 
 
 def error_if_negative(x: ArrayLike) -> Array:
     x = jnp.asarray(x)
-    return eqx.error_if(x, x < 0, "A non-negative quantity was found to be negative!")
+    return _error_if(x, x < 0, "A non-negative quantity was found to be negative!")
 
 
 def error_if_not_positive(x: ArrayLike) -> Array:
     x = jnp.asarray(x)
-    return eqx.error_if(
-        x, x <= 0, "A positive quantity was found to be negative or zero!"
-    )
+    return _error_if(x, x <= 0, "A positive quantity was found to be negative or zero!")
 
 
 def error_if_zero(x: ArrayLike) -> Array:
     x = jnp.asarray(x)
-    return eqx.error_if(
-        x, jnp.isclose(x, 0.0), "A non-zero quantity was found to be zero!"
-    )
+    return _error_if(x, jnp.isclose(x, 0.0), "A non-zero quantity was found to be zero!")
 
 
 def error_if_not_fractional(x: ArrayLike) -> Array:
     x = jnp.asarray(x)
-    return eqx.error_if(
+    return _error_if(
         x,
         ~jnp.logical_and(x >= 0.0, x <= 1.0),
         "A fractional quantity was found to not be between 0 and 1!",
     )
+
+
+def _error_if(x: Array, pred: Bool[Array, "..."], msg: str) -> Array:
+    return eqx.error_if(x, pred, msg) if _ENABLE_RUNTIME_CHECKS else x
@@ -17,6 +17,7 @@ from ._fft import (
     fftn as fftn,
     ifftn as ifftn,
     irfftn as irfftn,
+    next_fast_fft_length as next_fast_fft_length,
     rfftn as rfftn,
 )
 from ._map_coordinates import (
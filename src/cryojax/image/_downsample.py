@@ -3,10 +3,10 @@
 from typing import overload
 
 import jax.numpy as jnp
-from jaxtyping import Array, Inexact
+from jaxtyping import Array, Complex, Float, Inexact
 
 from ._edges import crop_to_shape
-from ._fft import fftn, ifftn
+from ._fft import fftn, ifftn, rfftn
 
 
 @overload
@@ -122,6 +122,12 @@ def downsample_to_shape_with_fourier_cropping(
     the downsampled array in fourier space assuming hermitian symmetry,
     with the zero frequency component in the corner.
     """
+    if not get_real and jnp.issubdtype(image_or_volume.dtype, jnp.floating):
+        # ... for a real array returned in fourier space, only compute the
+        # non-redundant half space
+        return _downsample_real_array_to_shape_on_half_space(
+            image_or_volume, downsampled_shape
+        )
     fourier_array = jnp.fft.fftshift(fftn(image_or_volume))
     cropped_fourier_array = crop_to_shape(fourier_array, downsampled_shape)
     if get_real:
@@ -130,3 +136,34 @@ def downsample_to_shape_with_fourier_cropping(
         return jnp.fft.ifftshift(cropped_fourier_array)[
             ..., : downsampled_shape[-1] // 2 + 1
         ]
+
+
+def _downsample_real_array_to_shape_on_half_space(
+    image_or_volume: Float[Array, "_ _"] | Float[Array, "_ _ _"],
+    downsampled_shape: tuple[int, int] | tuple[int, int, int],
+) -> Complex[Array, "_ _"] | Complex[Array, "_ _ _"]:
+    fourier_array = rfftn(image_or_volume)
+    axes = tuple(range(image_or_volume.ndim - 1))
+    # In the last axis, the half space starts at the zero mode, so keep the first
+    # modes. If the downsampled shape is even, the last mode is the one at minus
+    # the nyquist frequency, which is the conjugate of the mode at plus the
+    # nyquist frequency with frequencies in the other axes negated
+    n_modes = downsampled_shape[-1] // 2
+    if downsampled_shape[-1] % 2 == 0:
+        nyquist_modes = fourier_array[..., n_modes]
+        for axis in axes:
+            nyquist_modes = jnp.roll(jnp.flip(nyquist_modes, axis), 1, axis)
+        fourier_array = jnp.concatenate(
+            (fourier_array[..., :n_modes], jnp.conj(nyquist_modes)[..., None]), axis=-1
+        )
+    else:
+        fourier_array = fourier_array[..., : n_modes + 1]
+    # ... and crop around the zero mode in all other axes
+    fourier_array = jnp.fft.fftshift(fourier_array, axes=axes)
+    cropped_fourier_array = fourier_array[
+        tuple(
+            slice(n // 2 - m // 2, n // 2 - m // 2 + m)
+            for n, m in zip(fourier_array.shape[:-1], downsampled_shape[:-1])
+        )
+    ]
+    return jnp.fft.ifftshift(cropped_fourier_array, axes=axes)
@@ -4,6 +4,7 @@ Routines to compute FFTs, in cryojax conventions.
 
 from typing import Optional
 
+import jax
 import jax.numpy as jnp
 from jaxtyping import Array, Complex, Float, Inexact
 
@@ -97,3 +98,50 @@ def rfftn(
     ft = jnp.fft.rfftn(jnp.fft.ifftshift(ift, axes=axes), s=s, axes=axes)
 
     return ft
+
+
+def next_fast_fft_length(n: int) -> int:
+    """Find the smallest FFT length greater than or equal to `n` whose
+    prime factors are only 2, 3, and 5. FFTs are fastest at these lengths,
+    and can be much slower for lengths with a large prime factor.
+
+    Arguments
+    ---------
+    n :
+        The minimum length.
+
+    Returns
+    -------
+    fast_length :
+        The smallest fast FFT length of at least `n`.
+    """
+    if n < 1:
+        raise ValueError(f"The FFT length must be a positive integer, but got {n}.")
+    fast_length = n
+    while True:
+        remainder = fast_length
+        for prime in (2, 3, 5):
+            while remainder % prime == 0:
+                remainder //= prime
+        if remainder == 1:
+            return fast_length
+        fast_length += 1
+
+
+def compute_hermitian_weights(
+    shape_in_real_space: tuple[int, int],
+) -> Float[Array, "{shape_in_real_space[0]} {shape_in_real_space[1]//2+1}"]:
+    """Weights for summing over the fourier modes of a real-valued image stored
+    on the half space. Modes in the first column, and in the nyquist column
+    of an image with an even number of columns, are counted once. All other
+    modes are counted twice, and the zero mode is thrown away.
+    """
+    y_dim, x_dim = shape_in_real_space
+    shape = (y_dim, x_dim // 2 + 1)
+    y_index = jax.lax.broadcasted_iota(int, shape, 0)
+    x_index = jax.lax.broadcasted_iota(int, shape, 1)
+    is_counted_once = x_index == 0
+    if x_dim % 2 == 0:
+        is_counted_once = jnp.logical_or(is_counted_once, x_index == x_dim // 2)
+    weights = jnp.where(is_counted_once, 1.0, 2.0)
+    return jnp.where(jnp.logical_and(x_index == 0, y_index == 0), 0.0, weights)
@@ -3,11 +3,15 @@ Image normalization routines.
 """
 
 import math
+from functools import partial
 from typing import Optional
 
+import jax
 import jax.numpy as jnp
 from jaxtyping import Array, Bool, Float, Inexact
 
+from ._fft import compute_hermitian_weights
+
 
 def normalize_image(
     image: Inexact[Array, "y_dim x_dim"],
@@ -68,32 +72,73 @@ def rescale_image(
         deviation ``N``.
     """
     image = jnp.asarray(image)
-    # First normalize image to zero mean and unit standard deviation
+    # Dispatch to a separately compiled kernel for real or fourier space,
+    # so that the choice of space is made outside of tracing
     if is_real:
-        normalized_image = (image - jnp.mean(image, where=where)) / jnp.std(
-            image, where=where
-        )
-        rescaled_image = std * normalized_image + mean
+        return _rescale_real_image(image, std, mean, where)
     else:
-        N1, N2 = image.shape
-        n_pixels = (
-            (
-                N1 * (2 * N2 - 1)
-                if shape_in_real_space is None
-                else math.prod(shape_in_real_space)
-            )
-            if half_space
-            else N1 * N2
+        return _rescale_fourier_image(
+            image,
+            std,
+            mean,
+            half_space=half_space,
+            shape_in_real_space=shape_in_real_space,
+        )
+
+
+@jax.jit
+def _rescale_real_image(
+    image: Inexact[Array, "y_dim x_dim"],
+    std: float | Float[Array, ""],
+    mean: float | Float[Array, ""],
+    where: Optional[Bool[Array, "y_dim x_dim"]],
+) -> Inexact[Array, "y_dim x_dim"]:
+    # First normalize image to zero mean and unit standard deviation
+    normalized_image = (image - jnp.mean(image, where=where)) / jnp.std(
+        image, where=where
+    )
+    return std * normalized_image + mean
+
+
+@partial(jax.jit, static_argnames=["half_space", "shape_in_real_space"])
+def _rescale_fourier_image(
+    image: Inexact[Array, "y_dim x_dim"],
+    std: float | Float[Array, ""],
+    mean: float | Float[Array, ""],
+    half_space: bool,
+    shape_in_real_space: Optional[tuple[int, int]],
+) -> Inexact[Array, "y_dim x_dim"]:
+    N1, N2 = image.shape
+    n_pixels = (
+        (
+            N1 * (2 * N2 - 1)
+            if shape_in_real_space is None
+            else math.prod(shape_in_real_space)
+        )
+        if half_space
+        else N1 * N2
+    )
+    # Set the zero mode with a broadcasted `where`, rather than a scatter
+    is_zero_mode = _get_zero_mode_mask(N1, N2)
+    image_with_zero_mean = jnp.where(is_zero_mode, 0.0, image)
+    if half_space:
+        # ... weight each mode on the half space by the number of times it
+        # appears on the full space
+        hermitian_weights = compute_hermitian_weights(
+            (N1, 2 * N2 - 1) if shape_in_real_space is None else shape_in_real_space
         )
-        image_with_zero_mean = image.at[0, 0].set(0.0)
         image_std = (
-            jnp.sqrt(
-                jnp.sum(jnp.abs(image_with_zero_mean[:, 0]) ** 2)
-                + 2 * jnp.sum(jnp.abs(image_with_zero_mean[:, 1:]) ** 2)
-            )
-            if half_space
-            else jnp.linalg.norm(image_with_zero_mean)
-        ) / n_pixels
-        normalized_image = image_with_zero_mean / image_std
-        rescaled_image = (normalized_image * std).at[0, 0].set(mean * n_pixels)
-    return rescaled_image
+            jnp.sqrt(jnp.sum(hermitian_weights * jnp.abs(image_with_zero_mean) ** 2))
+            / n_pixels
+        )
+    else:
+        image_std = jnp.linalg.norm(image_with_zero_mean) / n_pixels
+    # Then rescale to the given standard deviation and mean
+    normalized_image = image_with_zero_mean / image_std
+    return jnp.where(is_zero_mode, mean * n_pixels, normalized_image * std)
+
+
+def _get_zero_mode_mask(y_dim: int, x_dim: int) -> Bool[Array, "{y_dim} {x_dim}"]:
+    y_index = jax.lax.broadcasted_iota(int, (y_dim, x_dim), 0)
+    x_index = jax.lax.broadcasted_iota(int, (y_dim, x_dim), 1)
+    return jnp.logical_and(y_index == 0, x_index == 0)
@@ -2,6 +2,7 @@
 Routines for rescaling image pixel size.
 """
 
+from functools import partial
 from typing import Optional
 
 import jax
@@ -12,6 +13,7 @@ from jaxtyping import Array, Complex, Float
 from ._fft import irfftn, rfftn
 
 
+@partial(jax.jit, static_argnames=["method", "antialias"])
 def rescale_pixel_size(
     image: Float[Array, "y_dim x_dim"],
     current_pixel_size: Float[Array, ""],
@@ -22,7 +24,9 @@ def rescale_pixel_size(
     """
     Measure an image at a given pixel size using interpolation.
 
-    For more detail, see ``cryojax.utils.interpolation.scale``.
+    This is a single call to ``jax.image.scale_and_translate``, jitted
+    with ``method`` and ``antialias`` as static arguments. Unlike
+    ``jax.image.resize``, the shape of the image is preserved.
 
     Parameters
     ----------
@@ -248,30 +248,24 @@ def _compute_lowpass_filter(
     rolloff_width = rolloff_width_fraction * k_max
 
     radial_frequency_grid = jnp.linalg.norm(frequency_grid, axis=-1)
-
-    def compute_filter_at_frequency(radial_frequency):
-        return jnp.where(
-            radial_frequency <= cutoff_radius,
-            1.0,
-            jnp.where(
-                radial_frequency > cutoff_radius + rolloff_width,
-                0.0,
-                0.5
-                * (
-                    1
-                    + jnp.cos(jnp.pi * (radial_frequency - cutoff_radius) / rolloff_width)
-                ),
+    # Cosine soft-edge on the radial frequency, 1 inside the cutoff and 0 past the
+    # rolloff
+    return jnp.where(
+        radial_frequency_grid <= cutoff_radius,
+        1.0,
+        jnp.where(
+            radial_frequency_grid > cutoff_radius + rolloff_width,
+            0.0,
+            0.5
+            * (
+                1
+                + jnp.cos(
+                    jnp.pi * (radial_frequency_grid - cutoff_radius) / rolloff_width
+                )
             ),
-        )
-
-    compute_filter = (
-        jax.vmap(jax.vmap(compute_filter_at_frequency))
-        if radial_frequency_grid.ndim == 2
-        else jax.vmap(jax.vmap(jax.vmap(compute_filter_at_frequency)))
+        ),
     )
 
-    return compute_filter(radial_frequency_grid)
-
 
 def _compute_whitening_filter(
     image_stack: Float[Array, "n_images y_dim x_dim"],
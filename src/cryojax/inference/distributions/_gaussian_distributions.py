@@ -5,6 +5,7 @@ Image formation models simulated from gaussian noise distributions.
 from typing import Optional
 from typing_extensions import override
 
+import jax
 import jax.numpy as jnp
 import jax.random as jr
 from equinox import field
@@ -12,6 +13,7 @@ from jaxtyping import Array, Complex, Float, PRNGKeyArray
 
 from ..._errors import error_if_not_positive
 from ...image import normalize_image, rfftn
+from ...image._fft import compute_hermitian_weights
 from ...image.operators import Constant, FourierOperatorLike
 from ...simulator import AbstractImagingPipeline
 from ._base_distribution import AbstractDistribution
@@ -167,21 +169,34 @@ class IndependentGaussianFourierModes(AbstractDistribution, strict=True):
         simulated = self.compute_signal(get_real=False)
         # Compute residuals
         residuals = simulated - observed
-        # Compute standard normal random variables
-        squared_standard_normal_per_mode = jnp.abs(residuals) ** 2 / (2 * variance)
-        # Compute the log-likelihood for each fourier mode.
-        log_likelihood_per_mode = (
-            squared_standard_normal_per_mode - jnp.log(2 * jnp.pi * variance) / 2
+        # Compute standard normal random variables. Use real arithmetic for
+        # the squared residuals, rather than taking the complex modulus
+        squared_residuals = jax.lax.square(residuals.real) + jax.lax.square(
+            residuals.imag
         )
         # Compute log-likelihood, throwing away the zero mode. Need to take care
         # to compute the loss function in fourier space for a real-valued function.
-        log_likelihood = (
-            -1.0
-            * (
-                jnp.sum(log_likelihood_per_mode[1:, 0])
-                + 2 * jnp.sum(log_likelihood_per_mode[:, 1:])
+        hermitian_weights = compute_hermitian_weights(pipeline.instrument_config.shape)
+        if variance.ndim == 0:
+            # ... if the variance is the same for each fourier mode, factor it
+            # out of the sum. The weights add up to the number of modes on the
+            # full space, less the zero mode
+            log_likelihood = (
+                -1.0
+                * (
+                    jnp.sum(hermitian_weights * squared_residuals) * (0.5 / variance)
+                    - (n_pixels - 1) * jnp.log(2 * jnp.pi * variance) / 2
+                )
+                / n_pixels
+            )
+        else:
+            # ... otherwise, compute the log-likelihood for each fourier mode
+            squared_standard_normal_per_mode = squared_residuals * (0.5 / variance)
+            log_likelihood_per_mode = (
+                squared_standard_normal_per_mode - jnp.log(2 * jnp.pi * variance) / 2
+            )
+            log_likelihood = (
+                -1.0 * jnp.sum(hermitian_weights * log_likelihood_per_mode) / n_pixels
             )
-            / n_pixels
-        )
 
         return log_likelihood
@@ -17,6 +17,7 @@ from ._imaging_pipeline import (
     ContrastImagingPipeline as ContrastImagingPipeline,
     ElectronCountingImagingPipeline as ElectronCountingImagingPipeline,
     IntensityImagingPipeline as IntensityImagingPipeline,
+    render_image_stack as render_image_stack,
 )
 from ._instrument_config import InstrumentConfig as InstrumentConfig
 from ._pose import (
@@ -137,17 +137,34 @@ class AbstractDetector(Module, strict=True):
             "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}",
         ],
         instrument_config: InstrumentConfig,
-    ) -> Complex[
-        Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
-    ]:
-        """Measure the readout from the detector."""
-        fourier_detector_readout = self._compute_expected_events_or_detector_readout(
+        *,
+        get_real: bool = False,
+    ) -> (
+        Complex[
+            Array,
+            "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}",
+        ]
+        | Float[
+            Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim}"
+        ]
+    ):
+        """Measure the readout from the detector.
+
+        **Arguments:**
+
+        - `get_real`: If `True`, return the readout in real space. The readout is
+                      sampled in real space, so this avoids a round trip to fourier
+                      space and back if the readout is going to be postprocessed
+                      in real space.
+        """
+        detector_readout = self._compute_expected_events_or_detector_readout(
             fourier_squared_wavefunction_at_detector_plane,
             instrument_config,
             key,
+            get_real=get_real,
         )
 
-        return fourier_detector_readout
+        return detector_readout
 
     def _compute_expected_events_or_detector_readout(
         self,
@@ -157,12 +174,19 @@ class AbstractDetector(Module, strict=True):
         ],
         instrument_config: InstrumentConfig,
         key: Optional[PRNGKeyArray] = None,
-    ) -> Complex[
-        Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
-    ]:
+        *,
+        get_real: bool = False,
+    ) -> (
+        Complex[
+            Array,
+            "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}",
+        ]
+        | Float[
+            Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim}"
+        ]
+    ):
         """Pass the image through the detector model."""
         N_pix = np.prod(instrument_config.padded_shape)
-        frequency_grid = instrument_config.padded_frequency_grid_in_pixels
         # Compute the time-integrated electron flux in pixels
         electrons_per_pixel = (
             instrument_config.electrons_per_angstrom_squared
@@ -175,23 +199,32 @@ class AbstractDetector(Module, strict=True):
             fourier_squared_wavefunction_at_detector_plane[0, 0]
         )
         # Compute the noiseless signal by applying the DQE to the squared wavefunction
-        fourier_signal = fourier_squared_wavefunction_at_detector_plane * jnp.sqrt(
-            self.dqe(frequency_grid)
-        )
+        if isinstance(self.dqe, IdealDQE):
+            # ... the ideal DQE is the same at all frequencies, so skip evaluating
+            # it on the frequency grid
+            fourier_signal = fourier_squared_wavefunction_at_detector_plane * jnp.sqrt(
+                self.dqe.fraction_detected_electrons
+            )
+        else:
+            frequency_grid = instrument_config.padded_frequency_grid_in_pixels
+            fourier_signal = fourier_squared_wavefunction_at_detector_plane * jnp.sqrt(
+                self.dqe(frequency_grid)
+            )
         # Apply the integrated dose rate
         fourier_expected_electron_events = electrons_per_image * fourier_signal
         if key is None:
             # If there is no key given, return
             return fourier_expected_electron_events
         else:
-            # ... otherwise, go to real space, sample, go back to fourier,
-            # and return.
+            # ... otherwise, go to real space, sample, and return in either
+            # real or fourier space.
             expected_electron_events = irfftn(
                 fourier_expected_electron_events, s=instrument_config.padded_shape
             )
-            return rfftn(
-                self.sample_readout_from_expected_events(key, expected_electron_events)
+            detector_readout = self.sample_readout_from_expected_events(
+                key, expected_electron_events
             )
+            return detector_readout if get_real else rfftn(detector_readout)
 
 
 class GaussianDetector(AbstractDetector, strict=True):
@@ -3,14 +3,17 @@ Image formation models.
 """
 
 from abc import abstractmethod
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Optional
 from typing_extensions import override
 
 import jax
 from equinox import AbstractVar, Module
-from jaxtyping import Array, Complex, Float, PRNGKeyArray
+from jaxtyping import Array, Complex, Float, Inexact, Key, PRNGKeyArray, UInt32
 
-from ..image import irfftn, rfftn
+from .._filter_specs import get_filter_spec
+from .._filtered_transformations import filter_vmap_with_spec
+from ..image import crop_to_shape, irfftn, rfftn
 from ..image.operators import FilterLike, MaskLike
 from ._detector import AbstractDetector
 from ._instrument_config import InstrumentConfig
@@ -85,39 +88,75 @@ class AbstractImagingPipeline(Module, strict=True):
         in either real or fourier space.
         """
         instrument_config = self.instrument_config
+        filter_array, mask_array = self._get_filter_and_mask_arrays()
         if (
-            self.mask is None
+            mask_array is None
             and instrument_config.padded_shape == instrument_config.shape
         ):
             # ... if there are no masks and we don't need to crop,
             # minimize moving back and forth between real and fourier space
-            if self.filter is not None:
-                image = self.filter(image)
+            if filter_array is not None:
+                image = image * filter_array
             return irfftn(image, s=instrument_config.shape) if get_real else image
         else:
-            # ... otherwise, apply filter, crop, and mask, again trying to
-            # minimize moving back and forth between real and fourier space
-            is_filter_applied = True if self.filter is None else False
-            if (
-                self.filter is not None
-                and self.filter.array.shape
-                == instrument_config.padded_frequency_grid_in_pixels.shape[0:2]
-            ):
-                # ... apply the filter here if it is the same size as the padded
-                # coordinates
-                is_filter_applied = True
-                image = self.filter(image)
-            image = irfftn(image, s=instrument_config.padded_shape)
-            image = instrument_config.crop_to_shape(image)
-            if self.mask is not None:
-                image = self.mask(image)
-            if is_filter_applied or self.filter is None:
-                return image if get_real else rfftn(image)
-            else:
-                # ... otherwise, apply the filter here and return. assume
-                # the filter is the same size as the non-padded coordinates
-                image = self.filter(rfftn(image))
-                return irfftn(image, s=instrument_config.shape) if get_real else image
+            # ... otherwise, apply filter, crop, and mask in a single jitted
+            # kernel, so that XLA can fuse the pointwise operations into the FFTs
+            return _filter_crop_and_mask(
+                image,
+                filter_array,
+                mask_array,
+                padded_shape=instrument_config.padded_shape,
+                shape=instrument_config.shape,
+                get_real=get_real,
+            )
+
+    def _is_detector_readout_kept_in_real_space(
+        self, *, postprocess: bool = True, get_real: bool = True
+    ) -> bool:
+        # A detector readout sampled in real space can be postprocessed without
+        # first going to fourier space, unless a filter must be applied before
+        # cropping. Without postprocessing, keep it in real space if it is returned
+        # in real space
+        if postprocess:
+            return self.filter is None or not _is_filter_applied_before_crop(
+                self.filter.array, self.instrument_config.padded_shape
+            )
+        else:
+            return get_real
+
+    def _postprocess_real_image(
+        self,
+        real_image: Float[
+            Array,
+            "{self.instrument_config.padded_y_dim} "
+            "{self.instrument_config.padded_x_dim}",
+        ],
+        *,
+        get_real: bool = True,
+    ) -> (
+        Float[Array, "{self.instrument_config.y_dim} {self.instrument_config.x_dim}"]
+        | Complex[
+            Array,
+            "{self.instrument_config.y_dim} {self.instrument_config.x_dim//2+1}",
+        ]
+    ):
+        filter_array, mask_array = self._get_filter_and_mask_arrays()
+        return _crop_mask_and_filter(
+            real_image,
+            filter_array,
+            mask_array,
+            shape=self.instrument_config.shape,
+            get_real=get_real,
+        )
+
+    def _get_filter_and_mask_arrays(
+        self,
+    ) -> tuple[Optional[Inexact[Array, "_ _"]], Optional[Float[Array, "_ _"]]]:
+        filter_array = (
+            None if self.filter is None else jax.lax.stop_gradient(self.filter.array)
+        )
+        mask_array = None if self.mask is None else jax.lax.stop_gradient(self.mask.array)
+        return filter_array, mask_array
 
     def _maybe_postprocess(
         self,
@@ -378,15 +417,148 @@ class ElectronCountingImagingPipeline(AbstractImagingPipeline, strict=True):
                     self.instrument_config, keys[0]
                 )
             )
-            # ... now measure the detector readout
-            fourier_detector_readout = self.detector.compute_detector_readout(
-                keys[1],
-                fourier_squared_wavefunction_at_detector_plane,
-                self.instrument_config,
-            )
+            # ... now measure the detector readout. This is sampled in real space,
+            # so if the postprocessing can start in real space, stay there
+            if self._is_detector_readout_kept_in_real_space(
+                postprocess=postprocess, get_real=get_real
+            ):
+                detector_readout = self.detector.compute_detector_readout(
+                    keys[1],
+                    fourier_squared_wavefunction_at_detector_plane,
+                    self.instrument_config,
+                    get_real=True,
+                )
 
-            return self._maybe_postprocess(
-                fourier_detector_readout,
-                postprocess=postprocess,
-                get_real=get_real,
-            )
+                return (
+                    self._postprocess_real_image(detector_readout, get_real=get_real)
+                    if postprocess
+                    else detector_readout
+                )
+            else:
+                fourier_detector_readout = self.detector.compute_detector_readout(
+                    keys[1],
+                    fourier_squared_wavefunction_at_detector_plane,
+                    self.instrument_config,
+                )
+
+                return self._maybe_postprocess(
+                    fourier_detector_readout,
+                    postprocess=postprocess,
+                    get_real=get_real,
+                )
+
+
+def render_image_stack(
+    imaging_pipeline: AbstractImagingPipeline,
+    where: Callable[[AbstractImagingPipeline], Any],
+    rng_keys: Optional[Key[Array, " n_images"] | UInt32[Array, "n_images 2"]] = None,
+    *,
+    postprocess: bool = True,
+    get_real: bool = True,
+) -> Float[Array, "n_images _ _"] | Complex[Array, "n_images _ _"]:
+    """Render a stack of images from an `imaging_pipeline`, where the
+    parameters pointed to by `where` have a leading batch dimension.
+
+    ```python
+    # Render a stack of images at different poses
+    poses = jax.vmap(lambda phi: cs.EulerAnglePose(view_phi=phi))(view_phis)
+    imaging_pipeline = eqx.tree_at(
+        lambda x: x.scattering_theory.structural_ensemble.pose,
+        imaging_pipeline,
+        poses,
+    )
+    image_stack = render_image_stack(
+        imaging_pipeline, lambda x: x.scattering_theory.structural_ensemble.pose
+    )
+    ```
+
+    All other parameters are shared across the stack, so the images are
+    rendered in a single vectorized computation. This is typically
+    called under `equinox.filter_jit`.
+
+    **Arguments:**
+
+    - `imaging_pipeline`: The image formation model.
+    - `where`: A pointer to the parameters in `imaging_pipeline` that are
+               batched over.
+    - `rng_keys`: A batch of random number generator keys, one per image. If
+                  not passed, render images with no stochasticity.
+    - `postprocess`: As in `AbstractImagingPipeline.render`.
+    - `get_real`: As in `AbstractImagingPipeline.render`.
+    """
+    filter_spec = get_filter_spec(imaging_pipeline, where)
+
+    @partial(filter_vmap_with_spec, filter_spec=filter_spec)
+    def compute_image_stack(pipeline, *keys):
+        return pipeline.render(*keys, postprocess=postprocess, get_real=get_real)
+
+    if rng_keys is None:
+        return compute_image_stack(imaging_pipeline)
+    else:
+        return compute_image_stack(imaging_pipeline, rng_keys)
+
+
+@partial(jax.jit, static_argnames=["padded_shape", "shape", "get_real"])
+def _filter_crop_and_mask(
+    image: Complex[Array, "_ _"],
+    filter_array: Optional[Inexact[Array, "_ _"]],
+    mask_array: Optional[Float[Array, "_ _"]],
+    padded_shape: tuple[int, int],
+    shape: tuple[int, int],
+    get_real: bool,
+) -> Float[Array, "_ _"] | Complex[Array, "_ _"]:
+    # Apply the filter before cropping if it is the same size as the padded
+    # fourier-space image. Otherwise, assume it is the size of the cropped
+    # fourier-space image and apply it after masking
+    is_filter_applied_before_crop = filter_array is not None and (
+        _is_filter_applied_before_crop(filter_array, padded_shape)
+    )
+    if is_filter_applied_before_crop:
+        image = image * filter_array
+    real_image = crop_to_shape(irfftn(image, s=padded_shape), shape)
+    return _mask_and_filter_cropped_image(
+        real_image,
+        None if is_filter_applied_before_crop else filter_array,
+        mask_array,
+        shape,
+        get_real,
+    )
+
+
+@partial(jax.jit, static_argnames=["shape", "get_real"])
+def _crop_mask_and_filter(
+    real_image: Float[Array, "_ _"],
+    filter_array: Optional[Inexact[Array, "_ _"]],
+    mask_array: Optional[Float[Array, "_ _"]],
+    shape: tuple[int, int],
+    get_real: bool,
+) -> Float[Array, "_ _"] | Complex[Array, "_ _"]:
+    # The same as `_filter_crop_and_mask`, but for an image that is already
+    # in real space and a filter that is the size of the cropped image
+    return _mask_and_filter_cropped_image(
+        crop_to_shape(real_image, shape), filter_array, mask_array, shape, get_real
+    )
+
+
+def _mask_and_filter_cropped_image(
+    real_image: Float[Array, "_ _"],
+    filter_array: Optional[Inexact[Array, "_ _"]],
+    mask_array: Optional[Float[Array, "_ _"]],
+    shape: tuple[int, int],
+    get_real: bool,
+) -> Float[Array, "_ _"] | Complex[Array, "_ _"]:
+    # Apply the mask to the cropped image in real space, then the filter in
+    # fourier space
+    if mask_array is not None:
+        real_image = real_image * mask_array
+    if filter_array is None:
+        return real_image if get_real else rfftn(real_image)
+    else:
+        image = rfftn(real_image) * filter_array
+        return irfftn(image, s=shape) if get_real else image
+
+
+def _is_filter_applied_before_crop(
+    filter_array: Inexact[Array, "_ _"], padded_shape: tuple[int, int]
+) -> bool:
+    return filter_array.shape == (padded_shape[0], padded_shape[1] // 2 + 1)
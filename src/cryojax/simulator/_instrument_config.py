@@ -15,6 +15,7 @@ from ..constants import convert_keV_to_angstroms
 from ..coordinates import make_coordinate_grid, make_frequency_grid
 from ..image import (
     crop_to_shape,
+    next_fast_fft_length,
     pad_to_shape,
     resize_with_crop_or_pad,
 )
@@ -41,6 +42,7 @@ class InstrumentConfig(Module, strict=True):
         *,
         pad_scale: float = 1.0,
         pad_mode: Union[str, Callable] = "constant",
+        pad_to_fast_fft_shape: bool = False,
     ):
         """**Arguments:**
 
@@ -62,6 +64,10 @@ class InstrumentConfig(Module, strict=True):
         - `pad_mode`:
             The method of image padding. By default, `"constant"`.
             For all options, see `jax.numpy.pad`.
+        - `pad_to_fast_fft_shape`:
+            If `True`, round `padded_shape` up so that each dimension has
+            only 2, 3, and 5 as prime factors. FFTs are fastest at these
+            sizes. See `cryojax.image.next_fast_fft_length`.
         """
         self.shape = shape
         self.pixel_size = error_if_not_positive(jnp.asarray(pixel_size))
@@ -74,9 +80,13 @@ class InstrumentConfig(Module, strict=True):
         self.pad_mode = pad_mode
         # Set shape after padding
         if padded_shape is None:
-            self.padded_shape = (int(pad_scale * shape[0]), int(pad_scale * shape[1]))
-        else:
-            self.padded_shape = padded_shape
+            padded_shape = (int(pad_scale * shape[0]), int(pad_scale * shape[1]))
+        if pad_to_fast_fft_shape:
+            padded_shape = (
+                next_fast_fft_length(padded_shape[0]),
+                next_fast_fft_length(padded_shape[1]),
+            )
+        self.padded_shape = padded_shape
 
     def __check_init__(self):
         if self.padded_shape[0] < self.shape[0] or self.padded_shape[1] < self.shape[1]:
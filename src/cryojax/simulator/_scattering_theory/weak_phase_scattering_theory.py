@@ -78,7 +78,10 @@ class WeakPhaseScatteringTheory(AbstractWeakPhaseScatteringTheory, strict=True):
         # Compute the phase shifts in the exit plane
         fourier_phase_shifts_at_exit_plane = (
             _compute_phase_shifts_from_integrated_potential(
-                self.structural_ensemble, self.potential_integrator, instrument_config
+                self.structural_ensemble,
+                self.potential_integrator,
+                instrument_config,
+                instrument_config.padded_frequency_grid_in_angstroms,
             )
         )
 
@@ -141,11 +144,19 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
     ) -> Complex[
         Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
     ]:
-        def compute_image(ensemble_mapped, ensemble_no_mapped, instrument_config):
+        def compute_image(
+            ensemble_mapped,
+            ensemble_no_mapped,
+            instrument_config,
+            frequency_grid_in_angstroms,
+        ):
             ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
             fourier_phase_shifts_at_exit_plane = (
                 _compute_phase_shifts_from_integrated_potential(
-                    ensemble, self.potential_integrator, instrument_config
+                    ensemble,
+                    self.potential_integrator,
+                    instrument_config,
+                    frequency_grid_in_angstroms,
                 )
             )
             return fourier_phase_shifts_at_exit_plane
@@ -154,9 +165,19 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
         def compute_image_superposition(
             ensemble_mapped, ensemble_no_mapped, instrument_config
         ):
+            # ... evaluate the frequency grid outside of the loop, rather than
+            # recomputing it per subunit
+            frequency_grid_in_angstroms = (
+                instrument_config.padded_frequency_grid_in_angstroms
+            )
             return jnp.sum(
                 jax.lax.map(
-                    lambda x: compute_image(x, ensemble_no_mapped, instrument_config),
+                    lambda x: compute_image(
+                        x,
+                        ensemble_no_mapped,
+                        instrument_config,
+                        frequency_grid_in_angstroms,
+                    ),
                     ensemble_mapped,
                 ),
                 axis=0,
@@ -196,59 +217,16 @@ class LinearSuperpositionScatteringTheory(AbstractWeakPhaseScatteringTheory, str
     ) -> Complex[
         Array, "{instrument_config.padded_y_dim} {instrument_config.padded_x_dim//2+1}"
     ]:
-        def compute_image(ensemble_mapped, ensemble_no_mapped, instrument_config):
-            ensemble = eqx.combine(ensemble_mapped, ensemble_no_mapped)
-            fourier_phase_shifts_at_exit_plane = (
-                _compute_phase_shifts_from_integrated_potential(
-                    ensemble, self.potential_integrator, instrument_config
-                )
-            )
-            fourier_contrast_at_detector_plane = self.transfer_theory(
-                fourier_phase_shifts_at_exit_plane, instrument_config
-            )
-
-            return fourier_contrast_at_detector_plane
-
-        @eqx.filter_jit
-        def compute_image_superposition(
-            ensemble_mapped, ensemble_no_mapped, instrument_config
-        ):
-            return jnp.sum(
-                jax.lax.map(
-                    lambda x: compute_image(x, ensemble_no_mapped, instrument_config),
-                    ensemble_mapped,
-                ),
-                axis=0,
-            )
-
-        # Get the batch
-        ensemble_batch = (
-            self.structural_ensemble_batcher.get_batched_structural_ensemble()
-        )
-        # Setup vmap over the pose and conformation
-        is_mapped = lambda x: isinstance(
-            x, (AbstractPose, AbstractConformationalVariable)
+        # The transfer theory is linear and the same for each structure in the
+        # batch, so compute the superposition of phase shifts (including those
+        # of the ice) and apply the CTF once
+        fourier_phase_shifts_at_exit_plane = (
+            self.compute_fourier_phase_shifts_at_exit_plane(instrument_config, rng_key)
         )
-        to_mapped = jax.tree_util.tree_map(is_mapped, ensemble_batch, is_leaf=is_mapped)
-        mapped, no_mapped = eqx.partition(ensemble_batch, to_mapped)
-
-        fourier_contrast_at_detector_plane = compute_image_superposition(
-            mapped, no_mapped, instrument_config
+        fourier_contrast_at_detector_plane = self.transfer_theory(
+            fourier_phase_shifts_at_exit_plane, instrument_config
         )
 
-        if rng_key is not None:
-            # Get the contrast from the ice and add to that of the image batch
-            if self.solvent is not None:
-                fourier_ice_contrast_at_detector_plane = self.transfer_theory(
-                    self.solvent.sample_fourier_phase_shifts_from_ice(
-                        rng_key, instrument_config
-                    ),
-                    instrument_config,
-                )
-                fourier_contrast_at_detector_plane += (
-                    fourier_ice_contrast_at_detector_plane
-                )
-
         return fourier_contrast_at_detector_plane
 
 
@@ -264,7 +242,10 @@ LinearSuperpositionScatteringTheory.__init__.__doc__ = """**Arguments:**
 
 
 def _compute_phase_shifts_from_integrated_potential(
-    structural_ensemble, potential_integrator, instrument_config
+    structural_ensemble,
+    potential_integrator,
+    instrument_config,
+    frequency_grid_in_angstroms,
 ):
     # Get potential in the lab frame
     potential = structural_ensemble.get_potential_in_lab_frame()
@@ -276,7 +257,7 @@ def _compute_phase_shifts_from_integrated_potential(
     )
     # Compute in-plane translation through fourier phase shifts
     translational_phase_shifts = structural_ensemble.pose.compute_shifts(
-        instrument_config.padded_frequency_grid_in_angstroms
+        frequency_grid_in_angstroms
     )
     # Compute the phase shifts in exit plane and multiply by the translation.
     phase_shifts_in_exit_plane = compute_phase_shifts_from_integrated_potential(
@@ -1,8 +1,6 @@
 import jax.numpy as jnp
 from jaxtyping import Array, Float
 
-from ...coordinates import cartesian_to_polar
-
 
 # Not currently public API
 def compute_phase_shifts(
@@ -14,14 +12,20 @@ def compute_phase_shifts(
     spherical_aberration_in_angstroms: Float[Array, ""],
     phase_shift: Float[Array, ""],
 ) -> Float[Array, "y_dim x_dim"]:
-    k_sqr, azimuth = cartesian_to_polar(frequency_grid_in_angstroms, square=True)
-    defocus = 0.5 * (
-        defocus_axis_1_in_angstroms
-        + defocus_axis_2_in_angstroms
+    k_y, k_x = frequency_grid_in_angstroms[..., 0], frequency_grid_in_angstroms[..., 1]
+    k_sqr = jnp.sum(jnp.square(frequency_grid_in_angstroms), axis=-1)
+    # Compute the defocus multiplied by the squared frequency. Expanding the
+    # astigmatism term k^2 cos(2 (azimuth - astigmatism_angle)) with the double
+    # angle formula avoids evaluating the azimuth and a cosine at each frequency
+    astigmatism_times_k_sqr = (k_x**2 - k_y**2) * jnp.cos(
+        2.0 * astigmatism_angle
+    ) + 2.0 * k_x * k_y * jnp.sin(2.0 * astigmatism_angle)
+    defocus_times_k_sqr = 0.5 * (
+        (defocus_axis_1_in_angstroms + defocus_axis_2_in_angstroms) * k_sqr
         + (defocus_axis_1_in_angstroms - defocus_axis_2_in_angstroms)
-        * jnp.cos(2.0 * (azimuth - astigmatism_angle))
+        * astigmatism_times_k_sqr
     )
-    defocus_phase_shifts = -0.5 * defocus * wavelength_in_angstroms * k_sqr
+    defocus_phase_shifts = -0.5 * defocus_times_k_sqr * wavelength_in_angstroms
     aberration_phase_shifts = (
         0.25
         * spherical_aberration_in_angstroms
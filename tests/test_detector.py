@@ -1,9 +1,10 @@
 import jax
 import jax.numpy as jnp
 import numpy as np
+import pytest
 
 import cryojax.simulator as cs
-from cryojax.image import irfftn, rfftn
+from cryojax.image import irfftn, operators as op, rfftn
 
 
 def test_constant_wavefunction_gives_constant_expected_events():
@@ -79,3 +80,49 @@ def test_gaussian_limit():
         ),
         rtol=1e-2,
     )
+
+
+def test_real_vs_fourier_detector_readout():
+    config = cs.InstrumentConfig((25, 25), 1.0, voltage_in_kilovolts=300.0)
+    fourier_vacuum_squared_wavefunction = rfftn(jnp.ones(config.shape, dtype=float))
+    key = jax.random.PRNGKey(1234)
+    detector = cs.PoissonDetector(cs.IdealDQE())
+    fourier_detector_readout = detector.compute_detector_readout(
+        key, fourier_vacuum_squared_wavefunction, config
+    )
+    detector_readout = detector.compute_detector_readout(
+        key, fourier_vacuum_squared_wavefunction, config, get_real=True
+    )
+    np.testing.assert_allclose(
+        irfftn(fourier_detector_readout, s=config.padded_shape), detector_readout
+    )
+
+
+@pytest.mark.parametrize("get_real", [True, False])
+def test_real_vs_fourier_postprocessed_detector_readout(config, theory, get_real):
+    # ... a filter at the cropped shape, so the readout is postprocessed in
+    # real space
+    filter = op.LowpassFilter(config.frequency_grid_in_pixels)
+    mask = op.CircularCosineMask(
+        config.coordinate_grid_in_angstroms,
+        radius_in_angstroms_or_pixels=20 * float(config.pixel_size),
+        rolloff_width_in_angstroms_or_pixels=3 * float(config.pixel_size),
+    )
+    detector = cs.PoissonDetector(cs.IdealDQE())
+    pipeline = cs.ElectronCountingImagingPipeline(
+        config, theory, detector, filter=filter, mask=mask
+    )
+    key = jax.random.PRNGKey(1234)
+    # Compute the readout in fourier space and postprocess it from there
+    keys = jax.random.split(key)
+    fourier_squared_wavefunction = (
+        theory.compute_fourier_squared_wavefunction_at_detector_plane(config, keys[0])
+    )
+    fourier_detector_readout = detector.compute_detector_readout(
+        keys[1], fourier_squared_wavefunction, config
+    )
+    np.testing.assert_allclose(
+        pipeline.render(key, get_real=get_real),
+        pipeline.postprocess(fourier_detector_readout, get_real=get_real),
+        atol=1e-8,
+    )
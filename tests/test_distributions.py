@@ -0,0 +1,36 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+import cryojax.inference.distributions as dist
+from cryojax.image import fftn, operators as op, rfftn
+from cryojax.image._fft import compute_hermitian_weights
+
+
+jax.config.update("jax_enable_x64", True)
+
+
+@pytest.mark.parametrize("shape", [(32, 32), (31, 31), (32, 31), (31, 32)])
+def test_hermitian_weights_agree_with_full_space_sum(shape):
+    image = jax.random.normal(jax.random.PRNGKey(0), shape)
+    full_space_power = jnp.abs(fftn(image)) ** 2
+    np.testing.assert_allclose(
+        jnp.sum(compute_hermitian_weights(shape) * jnp.abs(rfftn(image)) ** 2),
+        jnp.sum(full_space_power) - full_space_power[0, 0],
+    )
+
+
+def test_constant_variance_agrees_with_variance_on_grid(noiseless_model):
+    variance = 2.5
+    distribution_with_constant = dist.IndependentGaussianFourierModes(
+        noiseless_model, op.Constant(variance)
+    )
+    distribution_with_grid = dist.IndependentGaussianFourierModes(
+        noiseless_model, op.FourierGaussian(amplitude=variance, b_factor=0.0)
+    )
+    observed = distribution_with_constant.sample(jax.random.PRNGKey(0), get_real=False)
+    np.testing.assert_allclose(
+        distribution_with_constant.log_likelihood(observed),
+        distribution_with_grid.log_likelihood(observed),
+    )
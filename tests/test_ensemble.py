@@ -4,6 +4,7 @@ import equinox as eqx
 import jax
 import jax.numpy as jnp
 import jax.tree_util as jtu
+import numpy as np
 
 import cryojax.simulator as cxs
 from cryojax.simulator import DiscreteConformationalVariable, DiscreteStructuralEnsemble
@@ -42,3 +43,18 @@ def test_conformation_vmap(potential, pose, projection_method, transfer_theory,
     # Vmap over conformations
     image_stack = compute_conformation_stack(vmap, novmap, config)
     assert image_stack.shape[0] == ensemble.conformation.value.shape[0]
+
+
+def test_render_image_stack(noisy_model):
+    where = lambda x: x.scattering_theory.structural_ensemble.pose
+    view_phis = jnp.asarray([0.0, 30.0, 60.0])
+    poses = jax.vmap(lambda phi: cxs.EulerAnglePose(view_phi=phi))(view_phis)
+    keys = jax.random.split(jax.random.PRNGKey(0), view_phis.size)
+    model_stack = eqx.tree_at(where, noisy_model, poses)
+    image_stack = eqx.filter_jit(cxs.render_image_stack)(model_stack, where)
+    noisy_image_stack = cxs.render_image_stack(model_stack, where, keys)
+    assert image_stack.shape == (view_phis.size, *noisy_model.instrument_config.shape)
+    for i, phi in enumerate(view_phis):
+        model = eqx.tree_at(where, noisy_model, cxs.EulerAnglePose(view_phi=phi))
+        np.testing.assert_allclose(image_stack[i], model.render(), atol=1e-8)
+        np.testing.assert_allclose(noisy_image_stack[i], model.render(keys[i]), atol=1e-8)
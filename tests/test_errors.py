@@ -0,0 +1,34 @@
+import importlib
+
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+import cryojax._errors as errors
+
+
+@pytest.fixture
+def reload_errors(monkeypatch):
+    def _reload_errors(value):
+        monkeypatch.setenv("CRYOJAX_ENABLE_RUNTIME_CHECKS", value)
+        return importlib.reload(errors)
+
+    yield _reload_errors
+    monkeypatch.delenv("CRYOJAX_ENABLE_RUNTIME_CHECKS")
+    importlib.reload(errors)
+
+
+@pytest.mark.parametrize("value", ["0", "false", "False"])
+def test_disable_runtime_checks(reload_errors, value):
+    reloaded_errors = reload_errors(value)
+    assert not reloaded_errors._ENABLE_RUNTIME_CHECKS
+    x = reloaded_errors.error_if_negative(-1.0)
+    np.testing.assert_allclose(x, jnp.asarray(-1.0))
+
+
+@pytest.mark.parametrize("value", ["1", "true", "True"])
+def test_enable_runtime_checks(reload_errors, value):
+    reloaded_errors = reload_errors(value)
+    assert reloaded_errors._ENABLE_RUNTIME_CHECKS
+    with pytest.raises(RuntimeError):
+        reloaded_errors.error_if_negative(-1.0)
@@ -217,3 +217,31 @@ def test_transform_by_rise_and_twist(sample_subunit_mrc_path, pixel_size):
         ),
         atol=1e-1,
     )
+
+
+def test_superposition_agrees_with_sum_over_subunits(sample_subunit_mrc_path, config):
+    helix = build_helix(sample_subunit_mrc_path, 1)
+    projection_method = cs.FourierSliceExtraction()
+    transfer_theory = cs.ContrastTransferTheory(cs.ContrastTransferFunction())
+    superposition_theory = cs.LinearSuperpositionScatteringTheory(
+        helix, projection_method, transfer_theory
+    )
+    # ... compute the phase shifts of each subunit separately, each with its
+    # own frequency grid
+    ensemble_batch = helix.get_batched_structural_ensemble()
+    is_mapped = lambda x: isinstance(x, cs.AbstractPose)
+    to_mapped = jax.tree_util.tree_map(is_mapped, ensemble_batch, is_leaf=is_mapped)
+    mapped, no_mapped = eqx.partition(ensemble_batch, to_mapped)
+    phase_shifts_of_subunits = [
+        cs.WeakPhaseScatteringTheory(
+            eqx.combine(jax.tree_util.tree_map(lambda x: x[i], mapped), no_mapped),
+            projection_method,
+            transfer_theory,
+        ).compute_fourier_phase_shifts_at_exit_plane(config)
+        for i in range(helix.n_subunits)
+    ]
+    np.testing.assert_allclose(
+        superposition_theory.compute_fourier_phase_shifts_at_exit_plane(config),
+        sum(phase_shifts_of_subunits),
+        atol=1e-8,
+    )
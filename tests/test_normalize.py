@@ -1,8 +1,9 @@
 import jax
 import jax.numpy as jnp
 import numpy as np
+import pytest
 
-from cryojax.image import irfftn, normalize_image
+from cryojax.image import irfftn, normalize_image, rescale_image, rfftn
 
 
 jax.config.update("jax_enable_x64", True)
@@ -22,3 +23,15 @@ def test_fourier_vs_real_normalized_image(noisy_model):
     for im in [im1, im2]:
         np.testing.assert_allclose(jnp.std(im), jnp.asarray(1.0), rtol=1e-3)
         np.testing.assert_allclose(jnp.mean(im), jnp.asarray(0.0), atol=1e-8)
+
+
+@pytest.mark.parametrize("shape", [(32, 32), (31, 31), (32, 31), (31, 32)])
+def test_fourier_vs_real_rescaled_image(shape):
+    image = jax.random.normal(jax.random.PRNGKey(0), shape)
+    std, mean = 2.0, 1.5
+    im1 = rescale_image(image, std, mean, is_real=True)
+    im2 = irfftn(
+        rescale_image(rfftn(image), std, mean, is_real=False, shape_in_real_space=shape),
+        s=shape,
+    )
+    np.testing.assert_allclose(im1, im2, atol=1e-12)
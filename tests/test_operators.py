@@ -0,0 +1,53 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+import cryojax.simulator as cs
+from cryojax.image import operators as op
+
+
+jax.config.update("jax_enable_x64", True)
+
+
+@pytest.mark.parametrize("dtype", [jnp.bfloat16, jnp.float16, jnp.float32])
+def test_multiplier_astype(filters, masks, dtype):
+    for multiplier in [filters, masks]:
+        low_precision_multiplier = multiplier.astype(dtype)
+        assert type(low_precision_multiplier) is type(multiplier)
+        assert low_precision_multiplier.array.dtype == dtype
+        assert low_precision_multiplier.array.shape == multiplier.array.shape
+
+
+@pytest.mark.parametrize("image_dtype", [jnp.float32, jnp.complex64])
+def test_low_precision_multiplier_preserves_image_dtype(filters, masks, image_dtype):
+    for multiplier in [filters, masks]:
+        image = jnp.ones(multiplier.array.shape, dtype=image_dtype)
+        filtered_image = multiplier.astype(jnp.bfloat16)(image)
+        assert filtered_image.dtype == image_dtype
+        np.testing.assert_allclose(
+            filtered_image, multiplier(image).astype(image_dtype), rtol=1e-2, atol=1e-2
+        )
+
+
+def test_pipeline_with_low_precision_multipliers(config, theory, filters):
+    # ... the mask is applied after cropping to the unpadded shape
+    masks = op.CircularCosineMask(
+        config.coordinate_grid_in_angstroms,
+        radius_in_angstroms_or_pixels=20 * float(config.pixel_size),
+        rolloff_width_in_angstroms_or_pixels=3 * float(config.pixel_size),
+    )
+    pipeline = cs.ContrastImagingPipeline(config, theory, filter=filters, mask=masks)
+    low_precision_pipeline = cs.ContrastImagingPipeline(
+        config,
+        theory,
+        filter=filters.astype(jnp.bfloat16),
+        mask=masks.astype(jnp.bfloat16),
+    )
+    image = pipeline.render()
+    low_precision_image = low_precision_pipeline.render()
+    assert low_precision_image.dtype == image.dtype
+    assert low_precision_image.shape == image.shape
+    np.testing.assert_allclose(
+        low_precision_image, image, atol=1e-2 * float(jnp.max(jnp.abs(image)))
+    )
@@ -2,7 +2,10 @@ import jax.random as jr
 import numpy as np
 import pytest
 
-from cryojax.image import downsample_with_fourier_cropping
+from cryojax.image import (
+    downsample_to_shape_with_fourier_cropping,
+    downsample_with_fourier_cropping,
+)
 
 
 @pytest.mark.parametrize("downsampling_factor", [1.0, 2.0, 4.0])
@@ -11,3 +14,28 @@ def test_rescale_by_downsampling_preserves_sum(downsampling_factor):
     random = 2.0 + 1.0 * jr.normal(rng_key, (100, 100))
     downsampled_random = downsample_with_fourier_cropping(random, downsampling_factor)
     np.testing.assert_allclose(random.sum(), downsampled_random.sum())
+
+
+@pytest.mark.parametrize(
+    "shape, downsampled_shape",
+    [
+        ((100, 100), (50, 50)),
+        ((100, 100), (51, 49)),
+        ((99, 101), (50, 51)),
+        ((40, 40, 40), (20, 20, 20)),
+        ((41, 39, 40), (21, 20, 19)),
+    ],
+)
+def test_downsample_on_half_space_agrees_with_full_space(shape, downsampled_shape):
+    rng_key = jr.PRNGKey(seed=1234)
+    random = jr.normal(rng_key, shape)
+    # ... a complex array is cropped on the full space
+    np.testing.assert_allclose(
+        downsample_to_shape_with_fourier_cropping(
+            random, downsampled_shape, get_real=False
+        ),
+        downsample_to_shape_with_fourier_cropping(
+            random.astype(complex), downsampled_shape, get_real=False
+        ),
+        atol=1e-10,
+    )
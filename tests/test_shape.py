@@ -58,3 +58,17 @@ def test_even_vs_odd_image_shape(shape, sample_mrc_path, pixel_size):
         pipeline_control.render(),
         atol=1e-4,
     )
+
+
+@pytest.mark.parametrize(
+    "shape, pad_scale, padded_shape",
+    [((65, 66), 1.1, (72, 72)), ((64, 64), 1.0, (64, 64)), ((67, 67), 1.0, (72, 72))],
+)
+def test_pad_to_fast_fft_shape(shape, pad_scale, padded_shape, theory, pixel_size):
+    config = cs.InstrumentConfig(
+        shape, pixel_size, 300.0, pad_scale=pad_scale, pad_to_fast_fft_shape=True
+    )
+    assert config.padded_shape == padded_shape
+    pipeline = cs.ContrastImagingPipeline(config, theory)
+    assert pipeline.render().shape == shape
+    assert pipeline.render(postprocess=False).shape == padded_shape